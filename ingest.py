@@ -5,16 +5,59 @@ Monitors a source directory for new subfolders, validates naming conventions,
 moves folders to a destination, and logs file details to Excel.
 """
 
+import argparse
+import errno
+import hashlib
+import logging
 import os
+import pickle
 import re
 import shutil
+import sys
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import MemoryHandler
+from operator import itemgetter
 from pathlib import Path
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional, Union
 import yaml
-import pandas as pd
 from openpyxl import load_workbook, Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+
+
+logger = logging.getLogger(__name__)
+
+# Sheets of the Excel processing log and their columns, in sheet order:
+# one row per processed folder, and an optional inventory of their files
+FOLDERS_SHEET = 'Folders'
+FOLDER_COLUMNS = ['Folder Name', 'Naming Flag', 'Processed Date', 'File Count']
+FILES_SHEET = 'Files'
+FILE_COLUMNS = ['Folder Name', 'File Name', 'File Path', 'File Created Date']
+_folder_row_values = itemgetter(*FOLDER_COLUMNS)
+_file_row_values = itemgetter(*FILE_COLUMNS)
+_CREATED_INDEX = FILE_COLUMNS.index('File Created Date')
+
+# Single-sheet log written by earlier versions, still read for folder names
+LEGACY_SHEET = 'Processing Log'
+
+# Number of processed folders to buffer before writing to the Excel log
+LOG_FLUSH_INTERVAL = 500
+
+# Fixes applied by normalize_folder_name, compiled once at import
+_NORMALIZE_FIX1 = re.compile(r'(\d{4}(?:\.\d{2})?)[-_]')
+_NORMALIZE_FIX2 = re.compile(r'^(\d{4}(?:\.\d{2})?)([^\s])')
+
+
+@lru_cache(maxsize=32)
+def _compile(pattern: Union[str, re.Pattern]) -> re.Pattern:
+    """Compile a regex pattern, caching the result across calls."""
+    return re.compile(pattern)
 
 
 def load_config(config_path: str = "config.yaml") -> dict:
@@ -23,34 +66,37 @@ def load_config(config_path: str = "config.yaml") -> dict:
         return yaml.safe_load(f)
 
 
-def normalize_folder_name(name: str, pattern: str) -> Tuple[str, str]:
+def normalize_folder_name(name: str, pattern: Union[str, re.Pattern]) -> Tuple[str, str]:
     """
     Validate and normalize folder name according to naming convention.
     
     Args:
         name: Original folder name
-        pattern: Regex pattern for validation
+        pattern: Regex pattern for validation, as a string or precompiled
         
     Returns:
         Tuple of (normalized_name, flag) where flag is 'OK' or 'X'
     """
+    regex = _compile(pattern)
+    
     # Check if name already matches the pattern
-    if re.match(pattern, name):
+    if regex.match(name):
         return name, 'OK'
     
     # Try to fix common issues: replace underscores/hyphens with spaces
     # Look for pattern: digits followed by underscore/hyphen
-    fixed_name = re.sub(r'(\d{4}(?:\.\d{2})?)[-_]', r'\1 ', name)
+    fixed_name, replaced = _NORMALIZE_FIX1.subn(r'\1 ', name)
     
-    # Check if the fix worked
-    if re.match(pattern, fixed_name):
+    # Check if the fix worked (an unchanged name is already known to fail)
+    if replaced and regex.match(fixed_name):
         return fixed_name, 'OK'
     
     # Try another approach: add space after project number if missing
-    fixed_name = re.sub(r'^(\d{4}(?:\.\d{2})?)([^\s])', r'\1 \2', name)
+    spaced_name, replaced = _NORMALIZE_FIX2.subn(r'\1 \2', name)
     
-    if re.match(pattern, fixed_name):
-        return fixed_name, 'OK'
+    # Skip the check if this produced a name that was already tried
+    if replaced and spaced_name != fixed_name and regex.match(spaced_name):
+        return spaced_name, 'OK'
     
     # If all fixes fail, return original name with flag
     return name, 'X'
@@ -64,19 +110,28 @@ def get_folder_files(folder_path: Path) -> List[Dict[str, any]]:
         folder_path: Path to the folder
         
     Returns:
-        List of dictionaries with file info
+        List of dictionaries with file info; creation dates are kept as raw
+        st_ctime timestamps and converted when written to the log
     """
     files_info = []
-    
-    for item in folder_path.rglob('*'):
-        if item.is_file():
-            created_time = datetime.fromtimestamp(item.stat().st_ctime)
-            files_info.append({
-                'file_name': item.name,
-                'file_path': str(item.relative_to(folder_path)),
-                'created_date': created_time
-            })
-    
+    root = str(folder_path)
+    pending = [root]
+
+    # Walk with os.scandir so file/dir checks use the cached directory entry
+    # and each file is stat'ed only once; symlinked files are listed as with
+    # Path.is_file(), but symlinked folders are not descended into
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    files_info.append({
+                        'file_name': entry.name,
+                        'file_path': os.path.relpath(entry.path, root),
+                        'created_ctime': entry.stat().st_ctime
+                    })
+                elif entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+
     return files_info
 
 
@@ -99,55 +154,143 @@ def move_folder(source: Path, destination_root: Path) -> Path:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         dest_path = destination_root / f"{source.name}_{timestamp}"
     
-    shutil.move(str(source), str(dest_path))
+    try:
+        # Same filesystem: a single rename, nothing is copied
+        os.rename(source, dest_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Different filesystem: fall back to copying the tree
+        shutil.move(str(source), str(dest_path))
     return dest_path
 
 
-def log_to_excel(data: List[Dict[str, any]], excel_path: str, retry_attempts: int, retry_delay: int):
+def _file_row(row: Dict[str, any]) -> list:
+    """
+    Get the values of a file inventory row in column order for writing.
+    
+    Args:
+        row: File row dictionary, with 'File Created Date' as a raw timestamp
+        
+    Returns:
+        List of cell values with the file creation date as a datetime
+    """
+    values = list(_file_row_values(row))
+    created = values[_CREATED_INDEX]
+    if created is not None:
+        values[_CREATED_INDEX] = datetime.fromtimestamp(created)
+    return values
+
+
+def _header_row(ws, columns: List[str]) -> list:
+    """
+    Build a bold header row for a worksheet.
+    
+    Args:
+        ws: Worksheet the header will be appended to
+        columns: Column names
+        
+    Returns:
+        List of header cells
+    """
+    header = []
+    for column in columns:
+        cell = WriteOnlyCell(ws, value=column)
+        cell.font = Font(bold=True)
+        header.append(cell)
+    return header
+
+
+def log_to_excel(folder_summary: List[Dict[str, any]], file_inventory: List[Dict[str, any]],
+                 excel_path: str, retry_attempts: int, retry_delay: int):
     """
     Log folder processing details to Excel with retry logic for locked files.
     
     Args:
-        data: List of dictionaries containing log data
+        folder_summary: List of dictionaries with one entry per folder
+        file_inventory: List of dictionaries with one entry per file, with
+            file creation dates as raw st_ctime timestamps
         excel_path: Path to Excel file
         retry_attempts: Number of retry attempts
         retry_delay: Delay between retries in seconds
     """
-    df = pd.DataFrame(data)
+    sheets = [(FOLDERS_SHEET, FOLDER_COLUMNS, folder_summary, _folder_row_values),
+              (FILES_SHEET, FILE_COLUMNS, file_inventory, _file_row)]
     
     for attempt in range(retry_attempts):
         try:
             # Check if Excel file exists
             if os.path.exists(excel_path):
-                # Read existing data
-                existing_df = pd.read_excel(excel_path)
-                # Append new data
-                combined_df = pd.concat([existing_df, df], ignore_index=True)
+                # Load the existing log to add the new rows; every sheet is
+                # still parsed here and the whole file is saved again below
+                wb = load_workbook(excel_path)
             else:
-                combined_df = df
+                # Create a new log in write-only mode
+                wb = Workbook(write_only=True)
+            
+            for sheet_name, columns, rows, row_values in sheets:
+                if not rows:
+                    continue
+                
+                if sheet_name in wb.sheetnames:
+                    ws = wb[sheet_name]
+                else:
+                    ws = wb.create_sheet(sheet_name)
+                    ws.append(_header_row(ws, columns))
+                
+                for row in rows:
+                    ws.append(row_values(row))
             
-            # Write to Excel
-            with pd.ExcelWriter(excel_path, engine='openpyxl', mode='w') as writer:
-                combined_df.to_excel(writer, index=False, sheet_name='Processing Log')
+            wb.save(excel_path)
             
-            print(f"Successfully logged {len(data)} entries to Excel.")
+            logger.info("Successfully logged %d folders and %d files to Excel.",
+                        len(folder_summary), len(file_inventory))
             return
             
         except PermissionError as e:
             if attempt < retry_attempts - 1:
-                print(f"Excel file is locked. Retry {attempt + 1}/{retry_attempts} in {retry_delay} seconds...")
+                logger.warning("Excel file is locked. Retry %d/%d in %s seconds...",
+                               attempt + 1, retry_attempts, retry_delay)
                 time.sleep(retry_delay)
             else:
-                print(f"ERROR: Could not write to Excel after {retry_attempts} attempts. File may be open.")
+                logger.error("ERROR: Could not write to Excel after %d attempts. File may be open.",
+                             retry_attempts)
                 raise e
 
 
-def get_processed_folders(excel_path: str) -> set:
+def _save_processed_cache(cache_path: str, processed: set):
+    """
+    Write the processed-folders set to the cache and remove stale cache files.
+    
+    Args:
+        cache_path: Path of the cache file to write
+        processed: Set of processed folder names
+    """
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    
+    # Write to a temporary file first so a partial write is never picked up
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(processed, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    
+    # Older caches belong to previous versions of the log
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if (entry.name.startswith('processed_folders_') and entry.name.endswith('.pkl')
+                    and entry.path != cache_path):
+                os.remove(entry.path)
+
+
+def get_processed_folders(excel_path: str, cache_dir: Optional[str] = None) -> set:
     """
     Get list of already processed folder names from Excel log.
     
     Args:
         excel_path: Path to Excel file
+        cache_dir: Directory for caching the result between runs, keyed by
+            the log's modification time and size (None disables the cache)
         
     Returns:
         Set of processed folder names
@@ -155,150 +298,325 @@ def get_processed_folders(excel_path: str) -> set:
     if not os.path.exists(excel_path):
         return set()
     
+    cache_path = None
+    if cache_dir:
+        stat = os.stat(excel_path)
+        key = f"{os.path.abspath(excel_path)}|{stat.st_mtime_ns}|{stat.st_size}"
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        cache_path = os.path.join(cache_dir, f"processed_folders_{digest}.pkl")
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Warning: Could not read processed folders cache: %s", e)
+    
     try:
-        df = pd.read_excel(excel_path)
-        if 'Folder Name' in df.columns:
-            return set(df['Folder Name'].unique())
+        # Stream the rows in read-only mode rather than loading every cell;
+        # the file inventory is never read
+        wb = load_workbook(excel_path, read_only=True, data_only=True)
+        try:
+            processed = set()
+            for sheet_name in (FOLDERS_SHEET, LEGACY_SHEET):
+                if sheet_name not in wb.sheetnames:
+                    continue
+                
+                rows = wb[sheet_name].iter_rows(values_only=True)
+                header = next(rows, ())
+                if 'Folder Name' in header:
+                    index = header.index('Folder Name')
+                    processed.update(str(row[index]) for row in rows
+                                     if len(row) > index and row[index] is not None)
+        finally:
+            wb.close()
     except Exception as e:
-        print(f"Warning: Could not read existing log: {e}")
+        logger.warning("Warning: Could not read existing log: %s", e)
+        return set()
+    
+    if cache_path:
+        try:
+            _save_processed_cache(cache_path, processed)
+        except OSError as e:
+            logger.warning("Warning: Could not write processed folders cache: %s", e)
+    
+    return processed
+
+
+def _flush_log(folder_summary: List[Dict[str, any]], file_inventory: List[Dict[str, any]],
+               excel_path: str, retry_attempts: int, retry_delay: int):
+    """
+    Write buffered log rows to Excel and clear the buffers.
+    
+    Args:
+        folder_summary: Buffered folder rows, emptied once written
+        file_inventory: Buffered file rows, emptied once written
+        excel_path: Path to Excel file
+        retry_attempts: Number of retry attempts
+        retry_delay: Delay between retries in seconds
+    """
+    if not folder_summary:
+        return
+    
+    try:
+        log_to_excel(folder_summary, file_inventory, excel_path, retry_attempts, retry_delay)
+        logger.info("  Logged to Excel successfully.")
+        folder_summary.clear()
+        file_inventory.clear()
+    except Exception as e:
+        logger.error("  ERROR: Could not log to Excel: %s", e)
+
+
+def _process_one_folder(folder: Path, normalized_name: str, flag: str, destination_dir: Path,
+                        name_lock, move_lock, include_files: bool
+                        ) -> Optional[Tuple[Dict[str, any], List[Dict[str, any]]]]:
+    """
+    Rename, scan and move a single folder.
     
-    return set()
+    Args:
+        folder: Source folder path
+        normalized_name: Folder name after normalization
+        flag: Naming flag from normalization, 'OK' or 'X'
+        destination_dir: Destination root directory
+        name_lock: Context manager held from the rename until the folder has
+            been moved, shared by folders that normalize to the same name
+        move_lock: Context manager held while moving the folder
+        include_files: Whether to return a file inventory for the folder
+        
+    Returns:
+        Tuple of (folder_row, file_rows), or None if it could not be moved
+    """
+    folder_name = folder.name
+    logger.info("\nProcessing folder: %s", folder_name)
+    
+    if flag == 'X':
+        logger.warning("  [%s] WARNING: Folder name does not match convention. Flagged with 'X'.",
+                       folder_name)
+    else:
+        logger.info("  [%s] Name validated: OK", folder_name)
+    
+    # Keep the normalized name reserved until the folder has left the source
+    with name_lock:
+        # Rename folder if normalized name is different
+        if normalized_name != folder_name:
+            new_folder_path = folder.parent / normalized_name
+            folder.rename(new_folder_path)
+            folder = new_folder_path
+            logger.info("  [%s] Renamed to: %s", folder_name, normalized_name)
+        
+        # Get all files in the folder
+        files_info = get_folder_files(folder)
+        logger.info("  [%s] Found %d files in folder.", folder_name, len(files_info))
+        
+        # Move folder to destination
+        try:
+            with move_lock:
+                moved_path = move_folder(folder, destination_dir)
+            logger.info("  [%s] Moved to: %s", folder_name, moved_path)
+        except Exception as e:
+            logger.error("  [%s] ERROR: Could not move folder: %s", folder_name, e)
+            return None
+    
+    # Prepare log data
+    folder_row = {
+        'Folder Name': normalized_name,
+        'Naming Flag': flag,
+        'Processed Date': datetime.now(),
+        'File Count': len(files_info)
+    }
+    
+    file_rows = []
+    if include_files:
+        for file_info in files_info:
+            file_rows.append({
+                'Folder Name': normalized_name,
+                'File Name': file_info['file_name'],
+                'File Path': file_info['file_path'],
+                'File Created Date': file_info['created_ctime']
+            })
+    
+    return folder_row, file_rows
 
 
-def process_folders(config: dict):
+def process_folders(config: dict, use_cache: bool = True):
     """
     Main processing function to scan, validate, move, and log folders.
     
     Args:
         config: Configuration dictionary
+        use_cache: Whether to use the on-disk processed-folders cache
     """
     source_dir = Path(config['source_dir'])
     destination_dir = Path(config['destination_dir'])
     excel_path = config['excel_log_path']
-    pattern = config['naming_pattern']
+    naming_re = re.compile(config['naming_pattern'])
     retry_attempts = config['retry_attempts']
     retry_delay = config['retry_delay_seconds']
+    cache_dir = config.get('cache_dir', '.cache') if use_cache else None
+    max_workers = config.get('max_workers', (os.cpu_count() or 1) + 4)
+    include_files = config.get('include_files', True)
     
     # Ensure directories exist
     if not source_dir.exists():
-        print(f"ERROR: Source directory does not exist: {source_dir}")
+        logger.error("ERROR: Source directory does not exist: %s", source_dir)
         return
     
     destination_dir.mkdir(parents=True, exist_ok=True)
     
+    # List the destination once rather than probing it for every folder;
+    # names are case-folded where the filesystem is case-insensitive
+    with os.scandir(destination_dir) as entries:
+        destination_names = {os.path.normcase(entry.name) for entry in entries}
+    
     # Get already processed folders
-    processed_folders = get_processed_folders(excel_path)
-    print(f"Found {len(processed_folders)} already processed folders in log.")
+    processed_folders = get_processed_folders(excel_path, cache_dir)
+    logger.info("Found %d already processed folders in log.", len(processed_folders))
     
-    # Get all subfolders in source directory
-    subfolders = [f for f in source_dir.iterdir() if f.is_dir()]
+    # Get all subfolders in source directory, using the directory entry type
+    # from the listing rather than a stat call per entry
+    with os.scandir(source_dir) as entries:
+        subfolders = [Path(entry.path) for entry in entries if entry.is_dir()]
     
     if not subfolders:
-        print("No subfolders found in source directory.")
+        logger.info("No subfolders found in source directory.")
         return
     
-    print(f"Found {len(subfolders)} subfolders to process.")
+    logger.info("Found %d subfolders to process.", len(subfolders))
     
-    # Process each subfolder
-    for folder in subfolders:
-        folder_name = folder.name
-        
-        # Skip if already processed
-        if folder_name in processed_folders:
-            print(f"Skipping '{folder_name}' - already processed.")
-            continue
-        
-        # Skip if already exists in destination
-        if (destination_dir / folder_name).exists():
-            print(f"Skipping '{folder_name}' - already exists in destination.")
-            continue
-        
-        print(f"\nProcessing folder: {folder_name}")
-        
-        # Validate and normalize name
-        normalized_name, flag = normalize_folder_name(folder_name, pattern)
-        
-        if flag == 'X':
-            print(f"  WARNING: Folder name does not match convention. Flagged with 'X'.")
-        else:
-            print(f"  Name validated: OK")
-        
-        # Rename folder if normalized name is different
-        if normalized_name != folder_name:
-            new_folder_path = folder.parent / normalized_name
-            folder.rename(new_folder_path)
-            folder = new_folder_path
-            print(f"  Renamed to: {normalized_name}")
-        
-        # Get all files in the folder
-        files_info = get_folder_files(folder)
-        print(f"  Found {len(files_info)} files in folder.")
-        
-        # Move folder to destination
+    # Moves within one filesystem are a cheap rename, so run them one at a
+    # time; only cross-filesystem copies benefit from running concurrently
+    same_filesystem = os.stat(source_dir).st_dev == os.stat(destination_dir).st_dev
+    move_lock = threading.Lock() if same_filesystem else nullcontext()
+    
+    # Process subfolders concurrently, buffering log rows so the Excel log
+    # is written once per batch rather than once per folder
+    folder_summary = []
+    file_inventory = []
+    pending_folders = 0
+    
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {}
+    collected = set()
+    
+    def collect(future):
+        """Wait for a folder to finish and add its rows to the log buffers."""
+        nonlocal pending_folders
+        collected.add(future)
         try:
-            moved_path = move_folder(folder, destination_dir)
-            print(f"  Moved to: {moved_path}")
+            result = future.result()
         except Exception as e:
-            print(f"  ERROR: Could not move folder: {e}")
-            continue
+            logger.error("  ERROR: Could not process folder '%s': %s", futures[future], e)
+            return
         
-        # Prepare log data
-        processed_date = datetime.now()
-        log_data = []
+        if result is None:
+            return
         
-        if files_info:
-            for file_info in files_info:
-                log_data.append({
-                    'Folder Name': normalized_name,
-                    'Naming Flag': flag,
-                    'Processed Date': processed_date,
-                    'File Name': file_info['file_name'],
-                    'File Path': file_info['file_path'],
-                    'File Created Date': file_info['created_date']
-                })
-        else:
-            # Log folder even if empty
-            log_data.append({
-                'Folder Name': normalized_name,
-                'Naming Flag': flag,
-                'Processed Date': processed_date,
-                'File Name': '(empty)',
-                'File Path': '',
-                'File Created Date': None
-            })
+        folder_row, file_rows = result
+        folder_summary.append(folder_row)
+        file_inventory.extend(file_rows)
+        pending_folders += 1
+    
+    try:
+        to_process = []
+        for folder in subfolders:
+            folder_name = folder.name
+            
+            # Skip if already processed
+            if folder_name in processed_folders:
+                logger.info("Skipping '%s' - already processed.", folder_name)
+                continue
+            
+            # Skip if already exists in destination
+            if os.path.normcase(folder_name) in destination_names:
+                logger.info("Skipping '%s' - already exists in destination.", folder_name)
+                continue
+            
+            # Validate and normalize name
+            normalized_name, flag = normalize_folder_name(folder_name, naming_re)
+            to_process.append((folder, normalized_name, flag))
         
-        # Write to Excel log
-        try:
-            log_to_excel(log_data, excel_path, retry_attempts, retry_delay)
-            print(f"  Logged to Excel successfully.")
-        except Exception as e:
-            print(f"  ERROR: Could not log to Excel: {e}")
+        # Folders that normalize to the same name would race to rename into
+        # it, so each such group shares a lock and is processed one by one
+        name_counts = Counter(os.path.normcase(normalized_name)
+                              for _, normalized_name, _ in to_process)
+        name_locks = {name: threading.Lock() for name, count in name_counts.items() if count > 1}
+        
+        for folder, normalized_name, flag in to_process:
+            name_lock = name_locks.get(os.path.normcase(normalized_name), nullcontext())
+            future = executor.submit(_process_one_folder, folder, normalized_name, flag,
+                                     destination_dir, name_lock, move_lock, include_files)
+            futures[future] = folder.name
+        
+        # Collect results in submission order so the log lists folders in
+        # the same order on every run, whichever finishes first
+        for future in futures:
+            collect(future)
+            
+            if pending_folders >= LOG_FLUSH_INTERVAL:
+                _flush_log(folder_summary, file_inventory, excel_path,
+                           retry_attempts, retry_delay)
+                pending_folders = 0
+    except BaseException:
+        # Don't start queued folders, but let running ones finish so every
+        # folder that was moved still gets logged
+        executor.shutdown(wait=True, cancel_futures=True)
+        for future in futures:
+            if future not in collected and future.done() and not future.cancelled():
+                collect(future)
+        raise
+    finally:
+        executor.shutdown(wait=True)
+        # Flush whatever was processed, even if the run was interrupted
+        _flush_log(folder_summary, file_inventory, excel_path, retry_attempts, retry_delay)
+
+
+def configure_logging(level: int = logging.INFO):
+    """
+    Send log messages to stdout through a buffer, so per-folder messages do
+    not each take the stdout lock; warnings and errors flush immediately.
+    
+    Args:
+        level: Minimum level of messages to output
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    buffer_handler = MemoryHandler(capacity=1000, flushLevel=logging.WARNING,
+                                   target=stream_handler)
+    logging.basicConfig(level=level, handlers=[buffer_handler])
 
 
 def main():
     """Main entry point for the script."""
-    print("="*60)
-    print("Folder Ingestion Script")
-    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("="*60)
+    parser = argparse.ArgumentParser(description="Folder Ingestion Script")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Re-read the Excel log instead of using the processed-folders cache")
+    args = parser.parse_args()
+    
+    configure_logging()
+    
+    logger.info("="*60)
+    logger.info("Folder Ingestion Script")
+    logger.info("Started at: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    logger.info("="*60)
     
     try:
         # Load configuration
         config = load_config()
-        print(f"\nConfiguration loaded:")
-        print(f"  Source: {config['source_dir']}")
-        print(f"  Destination: {config['destination_dir']}")
-        print(f"  Log: {config['excel_log_path']}")
+        logger.info("\nConfiguration loaded:")
+        logger.info("  Source: %s", config['source_dir'])
+        logger.info("  Destination: %s", config['destination_dir'])
+        logger.info("  Log: %s", config['excel_log_path'])
         
         # Process folders
-        process_folders(config)
+        process_folders(config, use_cache=not args.no_cache)
         
-        print("\n" + "="*60)
-        print("Processing complete.")
-        print("="*60)
+        logger.info("\n" + "="*60)
+        logger.info("Processing complete.")
+        logger.info("="*60)
         
     except Exception as e:
-        print(f"\nFATAL ERROR: {e}")
+        logger.error("\nFATAL ERROR: %s", e)
         raise
 
 